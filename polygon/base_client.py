@@ -1,14 +1,27 @@
 # ========================================================= #
+import asyncio
 import datetime
+import importlib.util
 import json
 import os
+import socket
+import threading
+import time
 from enum import Enum
-from typing import Union
+from typing import TYPE_CHECKING, Union
 
 import httpx
 import requests
-from httpx import Response as HttpxResponse
-from requests.models import Response
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+
+# HTTP/2 on the async client needs the optional h2 package (pip install polygon[http2]). Only probed, not imported
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+if TYPE_CHECKING:  # only needed for annotations
+    from httpx import Response as HttpxResponse
+    from requests.models import Response
 
 # ========================================================= #
 
@@ -25,6 +38,31 @@ TIME_FRAME_CHUNKS = {
     "year": datetime.timedelta(days=3500),
 }
 
+# connection pool sizing for the sync session. requests defaults to 10 connections per host which serializes
+# bigger fan-outs (e.g. threaded bulk functions)
+SYNC_POOL_CONNECTIONS = 32
+SYNC_POOL_MAXSIZE = 128
+
+# query string form of boolean params
+_BOOL_PARAMS = {True: "true", False: "false"}
+
+# max number of responses kept by the in-process TTL cache (see _get_cached_response). Oldest go first.
+RESPONSE_CACHE_MAXSIZE = 4096
+
+
+# ========================================================= #
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """
+    ``HTTPAdapter`` which enables TCP keepalive on its sockets, so idle pooled connections aren't silently dropped
+    between sparse requests. urllib3's default socket options (``TCP_NODELAY``) are kept.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+        super().init_poolmanager(*args, **kwargs)
+
 
 # ========================================================= #
 
@@ -158,11 +196,36 @@ class Base:
             elif output_type == "date":
                 return dt.date()
 
+    @staticmethod
+    def _fmt_date(dt, _format: str = "%Y-%m-%d"):
+        """
+        Format a date query param. Same output as ``normalize_datetime(dt, output_type='str')``, with short-circuits
+        for the common cases: params left as ``None`` and ``date``/``datetime`` objects.
+
+        :param dt: The date input. ``None``, a ``date``/``datetime`` object, a date string or a timestamp.
+        :param _format: The format string for the output. Defaults to ``YYYY-MM-DD``
+        :return: The formatted string, or ``None`` if the input was ``None``
+        """
+        if dt is None:
+            return None
+
+        if isinstance(dt, datetime.date):  # covers datetime.datetime too
+            if _format != "%Y-%m-%d":
+                return dt.strftime(_format)
+
+            # isoformat() of a date is YYYY-MM-DD and skips strftime's format string parsing (several times faster)
+            return (dt.date() if isinstance(dt, datetime.datetime) else dt).isoformat()
+
+        return Base.normalize_datetime(dt, output_type="str", _format=_format)
+
     @staticmethod
     def _change_enum(val: Union[str, Enum, float, int], allowed_type=str):
+        if val is None or type(val) is allowed_type:  # hot path. unset, or already of the plain required type
+            return val
+
         if isinstance(val, Enum):
             try:
-                return val.value
+                return val._value_  # plain attribute. .value goes through a descriptor on every access
 
             except AttributeError:
                 raise ValueError(
@@ -185,7 +248,23 @@ class Base:
             return val
 
     @staticmethod
-    def to_json_safe(response: Union[Response, dict]) -> dict:
+    def _clean_params(params: dict = None):
+        """
+        Drop query parameters which are not set (``None`` or empty string), so they are neither encoded nor sent.
+        ``False`` and ``0`` are kept since they are valid filter values. Booleans are sent as ``true``/``false``,
+        which is what the API expects (``requests`` would otherwise encode them as ``True``/``False``).
+        """
+        if not params:
+            return None
+
+        return {
+            key: _BOOL_PARAMS[value] if type(value) is bool else value
+            for key, value in params.items()
+            if value is not None and value != ""
+        }
+
+    @staticmethod
+    def to_json_safe(response: "Union[Response, dict]") -> dict:
         if isinstance(response, dict):
             return response
         try:
@@ -193,6 +272,49 @@ class Base:
         except json.decoder.JSONDecodeError as e:
             return vars(e)
 
+    @staticmethod
+    def _cache_key(path: str, params: dict = None) -> tuple:
+        return path, tuple(sorted(params.items())) if params else ()
+
+    def _cache_lookup(self, key: tuple, ttl: float):
+        """
+        Return the cached response for ``key`` if it is younger than ``ttl`` seconds. None otherwise. The raw body is
+        cached and decoded on every hit, so each caller gets its own fresh copy of the data.
+        """
+        entry = self._response_cache.get(key)
+
+        if entry is not None and time.monotonic() - entry[0] < ttl:
+            return json.loads(entry[1])
+
+    def _cache_store(self, key: tuple, response: "Union[Response, HttpxResponse]") -> "Union[dict, list]":
+        """
+        Decode a response and store it in the TTL cache. Only successful (HTTP 200) responses are cached, so errors are
+        retried on the next call. The oldest entry is evicted once the cache is full.
+
+        :return: The decoded response, same as ``to_json_safe``
+        """
+        try:
+            data = response.json()
+        except json.decoder.JSONDecodeError as e:
+            return vars(e)
+
+        if response.status_code != 200:
+            return data
+
+        if key not in self._response_cache and len(self._response_cache) >= RESPONSE_CACHE_MAXSIZE:
+            self._response_cache.pop(next(iter(self._response_cache)), None)
+
+        self._response_cache[key] = (time.monotonic(), response.content)
+
+        return data
+
+    def clear_cache(self):
+        """
+        Drop all responses cached by the client. Only a few endpoints with slowly changing data cache their
+        responses, see the docs of the individual methods.
+        """
+        self._response_cache.clear()
+
     def get_dates_between(self, from_date=None, to_date=None, include_to_date: bool = True) -> list:
         """
         Get a list of dates between the two specified dates (from_date and to_date)
@@ -252,8 +374,19 @@ class BaseClient(Base):
         self.time_out_conf = (connect_timeout, read_timeout)
         self.session = requests.session()
 
+        # pooled keep-alive connections, retrying transient failures. Final responses are still returned as is
+        _retry = Retry(total=3, backoff_factor=0.2, status_forcelist=(429, 500, 502, 503, 504), raise_on_status=False)
+        self.session.mount(
+            "https://",
+            _KeepAliveAdapter(
+                pool_connections=SYNC_POOL_CONNECTIONS, pool_maxsize=SYNC_POOL_MAXSIZE, max_retries=_retry
+            ),
+        )
+
         self.session.headers.update({"Authorization": f"Bearer {self.KEY}"})
 
+        self._response_cache, self._cache_lock = {}, threading.Lock()
+
     # Context Managers
     def __enter__(self):
         return self
@@ -270,7 +403,7 @@ class BaseClient(Base):
         self.session.close()
 
     # Internal Functions
-    def _get_response(self, path: str, params: dict = None, raw_response: bool = True) -> Union[Response, dict]:
+    def _get_response(self, path: str, params: dict = None, raw_response: bool = True) -> "Union[Response, dict]":
         """
         Get response on a path. Meant to be used internally but can be used if you know what you're doing
 
@@ -280,14 +413,39 @@ class BaseClient(Base):
                              status code or inspect the headers. Defaults to True which returns the ``Response`` object.
         :return: A Response object by default. Make ``raw_response=False`` to get JSON decoded Dictionary
         """
-        _res = self.session.request("GET", self.BASE + path, params=params, timeout=self.time_out_conf)
+        _res = self.session.request(
+            "GET", self.BASE + path, params=self._clean_params(params), timeout=self.time_out_conf
+        )
 
         if raw_response:
             return _res
 
         return self.to_json_safe(_res)
 
-    def get_page_by_url(self, url: str, raw_response: bool = False) -> Union[Response, dict]:
+    def _get_cached_response(self, path: str, params: dict = None, ttl: float = 60) -> "Union[dict, list]":
+        """
+        Same as ``_get_response(..., raw_response=False)``, but the decoded response is kept in an in-process cache
+        and served from there for ``ttl`` seconds.
+
+        :param path: RESTful path for the endpoint.
+        :param params: Query Parameters to be supplied with the request.
+        :param ttl: Number of seconds a cached response stays valid.
+        :return: The JSON decoded response
+        """
+        params = self._clean_params(params)
+        key = self._cache_key(path, params)
+
+        _res = self._cache_lookup(key, ttl)
+
+        if _res is not None:
+            return _res
+
+        _res = self._get_response(path, params=params)
+
+        with self._cache_lock:
+            return self._cache_store(key, _res)
+
+    def get_page_by_url(self, url: str, raw_response: bool = False) -> "Union[Response, dict]":
         """
         Get the next page of a response. The URl is returned within ``next_url`` attribute on endpoints which support
         pagination (e.g. the tickers endpoint). If the response doesn't contain this attribute, either all pages were
@@ -299,7 +457,7 @@ class BaseClient(Base):
                              dictionary.
         :return: Either a Dictionary or a Response object depending on value of raw_response. Defaults to Dict.
         """
-        _res = self.session.request("GET", url)
+        _res = self.session.request("GET", url, timeout=self.time_out_conf)
 
         if raw_response:
             return _res
@@ -307,8 +465,8 @@ class BaseClient(Base):
         return self.to_json_safe(_res)
 
     def get_next_page(
-        self, old_response: Union[Response, dict], raw_response: bool = False
-    ) -> Union[Response, dict, bool]:
+        self, old_response: "Union[Response, dict]", raw_response: bool = False
+    ) -> "Union[Response, dict, bool]":
         """
         Get the next page using the most recent old response. This function simply parses the next_url attribute
         from the  existing response and uses it to get the next page. Returns False if there is no next page
@@ -333,8 +491,8 @@ class BaseClient(Base):
             return False
 
     def get_previous_page(
-        self, old_response: Union[Response, dict], raw_response: bool = False
-    ) -> Union[Response, dict, bool]:
+        self, old_response: "Union[Response, dict]", raw_response: bool = False
+    ) -> "Union[Response, dict, bool]":
         """
         Get the previous page using the most recent old response. This function simply parses the previous_url attribute
         from the  existing response and uses it to get the previous page. Returns False if there is no previous page
@@ -416,7 +574,9 @@ class BaseClient(Base):
                 container.append(_res)
                 continue
 
-            container.append(self.to_json_safe(_res))
+            # decode once. next iteration reads next_url from the decoded page instead of decoding it again
+            _res = self.to_json_safe(_res)
+            container.append(_res)
 
         return container
 
@@ -444,12 +604,15 @@ class BaseClient(Base):
             max_pages -= 1
 
         # How many pages do you want?? YES!!!
-        if merge_all_pages:  # prepare for a merge
-            pages = [self.to_json_safe(_res)] + self.get_all_pages(_res, max_pages=max_pages, verbose=verbose)
-        elif raw_page_responses:  # we don't need your help, adventurer (no merge, no decoding)
+        if raw_page_responses and not merge_all_pages:  # we don't need your help, adventurer (no merge, no decoding)
             return [_res] + self.get_all_pages(_res, raw_responses=True, max_pages=max_pages, verbose=verbose)
+
+        _res = self.to_json_safe(_res)  # decoded only once, pagination reads next_url from it
+
+        if merge_all_pages:  # prepare for a merge
+            pages = [_res] + self.get_all_pages(_res, max_pages=max_pages, verbose=verbose)
         else:  # okay a little bit of help is fine  (no merge, only decoding)
-            return [self.to_json_safe(_res)] + self.get_all_pages(_res, max_pages=max_pages, verbose=verbose)
+            return [_res] + self.get_all_pages(_res, max_pages=max_pages, verbose=verbose)
 
         # We need your help adventurer  (decode and merge)
         container = []
@@ -1139,15 +1302,52 @@ class BaseAsyncClient(Base):
             connect=connect_timeout, read=read_timeout, pool=pool_timeout, write=write_timeout
         )
         self._conn_pool_limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive)
-        self.session = httpx.AsyncClient(timeout=self.time_out_conf, limits=self._conn_pool_limits)
 
-        self.session.headers.update({"Authorization": f"Bearer {self.KEY}"})
+        # HTTP/2 (when available) multiplexes concurrent requests over a single connection
+        self.session = httpx.AsyncClient(
+            timeout=self.time_out_conf,
+            limits=self._conn_pool_limits,
+            http2=HTTP2_AVAILABLE,
+            base_url=self.BASE,
+            headers={"Authorization": f"Bearer {self.KEY}"},
+        )
+
+        self._response_cache, self._cache_locks = {}, {}
 
     @staticmethod
     async def aw_task(aw, semaphore):
         async with semaphore:
             return await aw
 
+    async def _gather_bounded(self, aws, max_concurrent_workers: int = os.cpu_count() * 5) -> list:
+        """
+        Internal helper to await many coroutines concurrently, with at most ``max_concurrent_workers`` of them in
+        flight at a time.
+
+        :param aws: An iterable of coroutines to await
+        :param max_concurrent_workers: Max number of coroutines allowed to run at the same time. Defaults to
+                                       ``your cpu core count * 5``
+        :return: A list of results in the same order as ``aws``. If a coroutine raised, the exception object is
+                 placed at its position instead of being raised.
+        """
+        semaphore = asyncio.Semaphore(max_concurrent_workers)
+
+        return await asyncio.gather(*[self.aw_task(aw, semaphore) for aw in aws], return_exceptions=True)
+
+    async def batch(self, *aws, max_concurrent_workers: int = 10) -> list:
+        """
+        Run several independent calls on this client concurrently and get all their results in one go. Useful when
+        you need a few different endpoints for the same symbol, e.g.
+        ``await client.batch(client.get_ticker_details('AMD'), client.get_ticker_news('AMD'))``. - Async method
+
+        :param aws: The coroutines to run. These are simply the (not yet awaited) calls to methods of the client.
+        :param max_concurrent_workers: Max number of calls allowed to be in flight at the same time. Defaults to 10.
+        :return: A list of results in the same order as the calls passed in. If a call raised an exception, the
+                 exception object is placed at its position instead of being raised.
+        """
+
+        return await self._gather_bounded(aws, max_concurrent_workers=max_concurrent_workers)
+
     # Context Managers
     async def __aenter__(self):
         return self
@@ -1166,7 +1366,7 @@ class BaseAsyncClient(Base):
     # Internal Functions
     async def _get_response(
         self, path: str, params: dict = None, raw_response: bool = True
-    ) -> Union[HttpxResponse, dict]:
+    ) -> "Union[HttpxResponse, dict]":
         """
         Get response on a path - meant to be used internally but can be used if you know what you're doing
 
@@ -1177,7 +1377,7 @@ class BaseAsyncClient(Base):
         :return: A Response object by default. Make ``raw_response=False`` to get JSON decoded Dictionary
         """
         _res = await self.session.request(
-            "GET", self.BASE + path, params={key: value for key, value in params.items() if value} if params else None
+            "GET", self.BASE + path, params=self._clean_params(params), timeout=self.time_out_conf
         )
 
         if raw_response:
@@ -1185,7 +1385,40 @@ class BaseAsyncClient(Base):
 
         return self.to_json_safe(_res)
 
-    async def get_page_by_url(self, url: str, raw_response: bool = False) -> Union[HttpxResponse, dict]:
+    async def _get_cached_response(self, path: str, params: dict = None, ttl: float = 60) -> "Union[dict, list]":
+        """
+        Same as ``_get_response(..., raw_response=False)``, but the decoded response is kept in an in-process cache
+        and served from there for ``ttl`` seconds.
+        Concurrent misses on the same key wait for a single request instead of all hitting the API.
+
+        :param path: RESTful path for the endpoint.
+        :param params: Query Parameters to be supplied with the request.
+        :param ttl: Number of seconds a cached response stays valid.
+        :return: The JSON decoded response
+        """
+        params = self._clean_params(params)
+        key = self._cache_key(path, params)
+
+        _res = self._cache_lookup(key, ttl)
+
+        if _res is not None:
+            return _res
+
+        lock = self._cache_locks.setdefault(key, asyncio.Lock())
+
+        try:
+            async with lock:
+                _res = self._cache_lookup(key, ttl)  # filled in while we waited on the lock
+
+                if _res is not None:
+                    return _res
+
+                return self._cache_store(key, await self._get_response(path, params=params))
+        finally:
+            if not lock.locked() and self._cache_locks.get(key) is lock:
+                del self._cache_locks[key]
+
+    async def get_page_by_url(self, url: str, raw_response: bool = False) -> "Union[HttpxResponse, dict]":
         """
         Get the next page of a response. The URl is returned within ``next_url`` attribute on endpoints which support
         pagination (e.g. the tickers' endpoint). If the response doesn't contain this attribute, either all pages were
@@ -1197,7 +1430,7 @@ class BaseAsyncClient(Base):
                              dictionary.
         :return: Either a Dictionary or a Response object depending on value of raw_response. Defaults to Dict.
         """
-        _res = await self.session.request("GET", url)
+        _res = await self.session.request("GET", url, timeout=self.time_out_conf)
 
         if raw_response:
             return _res
@@ -1205,8 +1438,8 @@ class BaseAsyncClient(Base):
         return self.to_json_safe(_res)
 
     async def get_next_page(
-        self, old_response: Union[HttpxResponse, dict], raw_response: bool = False
-    ) -> Union[HttpxResponse, dict, bool]:
+        self, old_response: "Union[HttpxResponse, dict]", raw_response: bool = False
+    ) -> "Union[HttpxResponse, dict, bool]":
         """
         Get the next page using the most recent old response. This function simply parses the next_url attribute
         from the  existing response and uses it to get the next page. Returns False if there is no next page
@@ -1232,8 +1465,8 @@ class BaseAsyncClient(Base):
             return False
 
     async def get_previous_page(
-        self, old_response: Union[HttpxResponse, dict], raw_response: bool = False
-    ) -> Union[HttpxResponse, dict, bool]:
+        self, old_response: "Union[HttpxResponse, dict]", raw_response: bool = False
+    ) -> "Union[HttpxResponse, dict, bool]":
         """
         Get the previous page using the most recent old response. This function simply parses the previous_url attribute
         from the  existing response and uses it to get the previous page. Returns False if there is no previous page
@@ -1315,7 +1548,9 @@ class BaseAsyncClient(Base):
                 container.append(_res)
                 continue
 
-            container.append(self.to_json_safe(_res))
+            # decode once. next iteration reads next_url from the decoded page instead of decoding it again
+            _res = self.to_json_safe(_res)
+            container.append(_res)
 
         return container
 
@@ -1343,12 +1578,15 @@ class BaseAsyncClient(Base):
             max_pages -= 1
 
         # How many pages do you want?? YES!!!
-        if merge_all_pages:  # prepare for a merge
-            pages = [self.to_json_safe(_res)] + await self.get_all_pages(_res, max_pages=max_pages, verbose=verbose)
-        elif raw_page_responses:  # we don't need your help, adventurer (no merge, no decoding)
+        if raw_page_responses and not merge_all_pages:  # we don't need your help, adventurer (no merge, no decoding)
             return [_res] + await self.get_all_pages(_res, raw_responses=True, max_pages=max_pages, verbose=verbose)
+
+        _res = self.to_json_safe(_res)  # decoded only once, pagination reads next_url from it
+
+        if merge_all_pages:  # prepare for a merge
+            pages = [_res] + await self.get_all_pages(_res, max_pages=max_pages, verbose=verbose)
         else:  # okay a little bit of help is fine  (no merge, only decoding)
-            return [self.to_json_safe(_res)] + await self.get_all_pages(_res, max_pages=max_pages, verbose=verbose)
+            return [_res] + await self.get_all_pages(_res, max_pages=max_pages, verbose=verbose)
 
         # We need your help adventurer  (decode and merge)
         container = []
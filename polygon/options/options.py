@@ -3,7 +3,9 @@ from .. import base_client
 from typing import Union
 from os import cpu_count
 import datetime
+import sys
 from enum import Enum
+from functools import lru_cache
 
 # ========================================================= #
 
@@ -17,6 +19,14 @@ SYMBOL_FORMATS = {
     "trade_station": "{symbol} {yy}{mm}{dd}{_type}{strike}.{strike_dec}",
 }
 
+# option symbols only carry a 2 digit year. It is always assumed to be in the current century
+_CENTURY_BASE = datetime.date.today().year // 100 * 100
+
+_DIGIT_STRIP_TABLE = str.maketrans("", "", "0123456789")
+
+# common spellings resolved without a .lower() call. anything else falls back to the generic check
+_CALL_PUT_MAP = {"c": "C", "C": "C", "call": "C", "CALL": "C", "p": "P", "P": "P", "put": "P", "PUT": "P"}
+
 # ========================================================= #
 # OPTION SYMBOL HELPERS                                     #
 # ========================================================= #
@@ -57,9 +67,8 @@ def build_option_symbol(
         return build_polygon_option_symbol(underlying_symbol, expiry, call_or_put, strike_price, prefix_o=prefix_o)
 
     # post processing on input data
-    if isinstance(expiry, (datetime.datetime, datetime.date)):
-        expiry = expiry.strftime("%y%m%d")
-        yy, mm, dd = expiry[:2], expiry[2:4], expiry[4:]
+    if isinstance(expiry, datetime.date):  # datetime is a subclass of date
+        yy, mm, dd = f"{expiry.year % 100:02d}", f"{expiry.month:02d}", f"{expiry.day:02d}"
 
     elif isinstance(expiry, str) and len(expiry) == 6:
         yy, mm, dd = expiry[:2], expiry[2:4], expiry[4:]
@@ -69,7 +78,7 @@ def build_option_symbol(
             "in a date or datetime object"
         )
 
-    call_or_put = "C" if call_or_put.lower() in ["c", "call"] else "P"
+    call_or_put = _CALL_PUT_MAP.get(call_or_put) or ("C" if call_or_put.lower() in ["c", "call"] else "P")
 
     strike_price = int(float(strike_price)) if int(float(strike_price)) == float(strike_price) else strike_price
 
@@ -114,21 +123,7 @@ def parse_option_symbol(option_symbol: str, _format="polygon", output_format="ob
     if _format in ["polygon", "tradier"]:
         return parse_polygon_option_symbol(option_symbol, output_format)
 
-    _obj = OptionSymbol(option_symbol, symbol_format=_format)
-
-    if output_format in ["list", list]:
-        _obj = [_obj.underlying_symbol, _obj.expiry, _obj.call_or_put, _obj.strike_price, _obj.option_symbol]
-
-    elif output_format in ["dict", dict]:
-        _obj = {
-            "underlying_symbol": _obj.underlying_symbol,
-            "strike_price": _obj.strike_price,
-            "expiry": _obj.expiry,
-            "call_or_put": _obj.call_or_put,
-            "option_symbol": _obj.option_symbol,
-        }
-
-    return _obj
+    return _build_parsed_output(_parse_option_symbol_cached(option_symbol, _format), output_format)
 
 
 def convert_option_symbol_formats(option_symbol: str, from_format: str, to_format: str) -> str:
@@ -201,26 +196,21 @@ def build_polygon_option_symbol(
     :return: The option symbol in the format specified by polygon
     """
 
-    if isinstance(expiry, (datetime.datetime, datetime.date)):
-        expiry = expiry.strftime("%y%m%d")
+    if isinstance(expiry, datetime.date):  # datetime is a subclass of date. int formatting skips strftime
+        expiry = f"{expiry.year % 100:02d}{expiry.month:02d}{expiry.day:02d}"
 
     elif isinstance(expiry, str) and len(expiry) != 6:
         raise ValueError("Expiry string must have 6 characters. Format is: YYMMDD")
 
-    call_or_put = "C" if call_or_put.lower() in ["c", "call"] else "P"
+    call_or_put = _CALL_PUT_MAP.get(call_or_put) or ("C" if call_or_put.lower() in ["c", "call"] else "P")
 
-    if "." in str(strike_price):
-        strike, strike_dec = (
-            str(strike_price).split(".")[0].rjust(5, "0"),
-            str(strike_price).split(".")[1].ljust(3, "0")[:3],
-        )
-    else:
-        strike, strike_dec = str(int(strike_price)).rjust(5, "0"), "000"
+    # strike is encoded as price * 1000, zero padded to 8 digits (5 before the decimal point, 3 after)
+    strike = f"{round(float(strike_price) * 1000):08d}"
 
     if prefix_o:
-        return f"O:{underlying_symbol.upper()}{expiry}{call_or_put}{strike}{strike_dec}"
+        return f"O:{underlying_symbol.upper()}{expiry}{call_or_put}{strike}"
 
-    return f"{underlying_symbol.upper()}{expiry}{call_or_put}{strike}{strike_dec}"
+    return f"{underlying_symbol.upper()}{expiry}{call_or_put}{strike}"
 
 
 def parse_polygon_option_symbol(option_symbol: str, output_format="object"):
@@ -232,21 +222,7 @@ def parse_polygon_option_symbol(option_symbol: str, output_format="object"):
     :return: The parsed values either as an object, list or a dict as indicated by ``output_format``.
     """
 
-    _obj = OptionSymbol(option_symbol, symbol_format="polygon")
-
-    if output_format in ["list", list]:
-        _obj = [_obj.underlying_symbol, _obj.expiry, _obj.call_or_put, _obj.strike_price, _obj.option_symbol]
-
-    elif output_format in ["dict", dict]:
-        _obj = {
-            "underlying_symbol": _obj.underlying_symbol,
-            "strike_price": _obj.strike_price,
-            "expiry": _obj.expiry,
-            "call_or_put": _obj.call_or_put,
-            "option_symbol": _obj.option_symbol,
-        }
-
-    return _obj
+    return _build_parsed_output(_parse_option_symbol_cached(option_symbol, "polygon"), output_format)
 
 
 # ========================================================= #
@@ -1432,6 +1408,27 @@ class AsyncOptionsClient(base_client.BaseAsyncClient):
 
         return self.to_json_safe(_res)
 
+    async def get_bulk_last_trades(
+        self, tickers: list, max_concurrent_workers: int = cpu_count() * 5, raw_response: bool = False
+    ) -> list:
+        """
+        Get the most recent trade for many options contracts concurrently - Async method. Each request is the same as
+        :meth:`get_last_trade`, but all of them run concurrently instead of one after another.
+
+        :param tickers: A list of option contract symbols. Eg: ``['O:TSLA210903C00700000', 'TSLA210903P00700000']``
+        :param max_concurrent_workers: Max number of requests allowed in flight at a time. Defaults to
+                                       ``your cpu core count * 5``
+        :param raw_response: whether to return the ``Response`` Objects. Useful for when you need to say
+                             check the status code or inspect the headers. Defaults to False which returns the json
+                             decoded dictionaries.
+        :return: A list of responses in the same order as ``tickers``. If a request fails, the exception is placed at
+                 its position in the list instead of being raised.
+        """
+
+        return await self._gather_bounded(
+            [self.get_last_trade(ticker, raw_response=raw_response) for ticker in tickers], max_concurrent_workers
+        )
+
     async def get_daily_open_close(self, symbol: str, date, adjusted: bool = True, raw_response: bool = False):
         """
         Get the OCHLV and after-hours prices of a contract on a certain date.
@@ -1740,6 +1737,34 @@ class AsyncOptionsClient(base_client.BaseAsyncClient):
 
         return self.to_json_safe(_res)
 
+    async def get_bulk_previous_closes(
+        self,
+        tickers: list,
+        adjusted: bool = True,
+        max_concurrent_workers: int = cpu_count() * 5,
+        raw_response: bool = False,
+    ) -> list:
+        """
+        Get the previous day's OHLC for many options contracts concurrently - Async method. Each request is the same
+        as :meth:`get_previous_close`, but all of them run concurrently instead of one after another.
+
+        :param tickers: A list of option contract symbols. Eg: ``['O:TSLA210903C00700000', 'TSLA210903P00700000']``
+        :param adjusted: whether the results are adjusted for splits. By default, results are adjusted.
+                         Set this to false to get results that are NOT adjusted for splits.
+        :param max_concurrent_workers: Max number of requests allowed in flight at a time. Defaults to
+                                       ``your cpu core count * 5``
+        :param raw_response: whether to return the ``Response`` Objects. Useful for when you need to say
+                             check the status code or inspect the headers. Defaults to False which returns the json
+                             decoded dictionaries.
+        :return: A list of responses in the same order as ``tickers``. If a request fails, the exception is placed at
+                 its position in the list instead of being raised.
+        """
+
+        return await self._gather_bounded(
+            [self.get_previous_close(ticker, adjusted, raw_response=raw_response) for ticker in tickers],
+            max_concurrent_workers,
+        )
+
     # Technical Indicators
     async def get_sma(
         self,
@@ -2115,6 +2140,16 @@ class OptionSymbol:
     The custom object for parsed details from option symbols.
     """
 
+    # chains can mean thousands of these objects. slots skip the per instance __dict__
+    __slots__ = (
+        "underlying_symbol",
+        "_expiry",
+        "expiry",
+        "call_or_put",
+        "strike_price",
+        "option_symbol",
+    )
+
     def __init__(self, option_symbol: str, symbol_format="polygon"):
         """
         Parses the details from symbol and creates attributes for the object.
@@ -2124,98 +2159,150 @@ class OptionSymbol:
         :param symbol_format: Which formatting spec to use. Defaults to polygon. also supports ``tda`` which is the
                               format supported by TD Ameritrade
         """
-        if symbol_format not in SYMBOL_FORMATS:
-            pass
-
         if option_symbol.startswith("O:"):
             option_symbol = option_symbol[2:]
 
-        if symbol_format in ["polygon", "tradier"]:
-            self.underlying_symbol = option_symbol[:-15]
+        try:
+            _parser = self._PARSERS[symbol_format]
+        except KeyError:
+            raise ValueError(
+                f"Symbol format {symbol_format} is not supported for parsing (yet?). Supported formats are: "
+                f"{list(self._PARSERS.keys())}"
+            )
 
-            _len = len(self.underlying_symbol)
+        _parser(self, option_symbol, symbol_format)
 
-            # filter for those Corrections Ian talked about
-            self.underlying_symbol = "".join([x for x in self.underlying_symbol if not x.isdigit()])
+    @classmethod
+    def from_polygon(cls, option_symbol: str):
+        """
+        Alternate constructor to parse a symbol in polygon (or tradier) format without going through format dispatch.
 
-            self._expiry = option_symbol[_len : _len + 6]
+        :param option_symbol: the symbol you want to parse. Both ``TSLA211015P125000`` and ``O:TSLA211015P125000`` are
+                              valid
+        :return: The parsed :class:`OptionSymbol` object
+        """
+        _obj = cls.__new__(cls)
+        _obj._parse_polygon(option_symbol)
+        return _obj
 
-            self.expiry = datetime.date(
-                int(datetime.date.today().strftime("%Y")[:2] + self._expiry[:2]),
-                int(self._expiry[2:4]),
-                int(self._expiry[4:6]),
-            )
+    @classmethod
+    def from_tda(cls, option_symbol: str):
+        """
+        Alternate constructor to parse a symbol in TD Ameritrade format without going through format dispatch.
 
-            self.call_or_put = option_symbol[_len + 6].upper()
+        :param option_symbol: the symbol you want to parse. e.g. ``AMD_011422C155``
+        :return: The parsed :class:`OptionSymbol` object
+        """
+        _obj = cls.__new__(cls)
+        _obj._parse_tda(option_symbol)
+        return _obj
+
+    @classmethod
+    def _from_parsed(cls, parsed: tuple):
+        # build from the cached tuple produced by _parse_option_symbol_cached
+        _obj = cls.__new__(cls)
+        (
+            _obj.underlying_symbol,
+            _obj.expiry,
+            _obj.call_or_put,
+            _obj.strike_price,
+            _obj.option_symbol,
+            _obj._expiry,
+        ) = parsed
+        return _obj
+
+    # Parsers
+    def _parse_polygon(self, option_symbol: str, symbol_format: str = "polygon"):
+        if option_symbol.startswith("O:"):
+            option_symbol = option_symbol[2:]
 
-            self.strike_price = int(option_symbol[_len + 7 :]) / 1000
+        self.underlying_symbol = option_symbol[:-15]
 
-            self.strike_price = (
-                int(float(self.strike_price))
-                if int(float(self.strike_price)) == float(self.strike_price)
-                else self.strike_price
-            )
+        _len = len(self.underlying_symbol)
 
-            self.option_symbol = f"{self.underlying_symbol}{option_symbol[_len:]}"
+        # filter for those Corrections Ian talked about
+        if not self.underlying_symbol.isalpha():  # most symbols have no digits at all
+            self.underlying_symbol = self.underlying_symbol.translate(_DIGIT_STRIP_TABLE)
 
-        elif symbol_format in ["tda", "tos"]:
-            if symbol_format == "tos":
-                option_symbol, num = option_symbol[1:].upper(), 0
+        # a chain shares one underlying across thousands of contracts. keep a single copy of it
+        self.underlying_symbol = sys.intern(self.underlying_symbol)
 
-                for char in option_symbol:
-                    if char.isalpha():
-                        num += 1
-                        continue
-                    break
+        self._expiry = option_symbol[_len : _len + 6]
 
-                option_symbol = (
-                    f"{option_symbol[:num]}_{option_symbol[num+2:num+4]}{option_symbol[num+4:num+6]}"
-                    f"{option_symbol[num:num+2]}{option_symbol[num+6:]}"
-                )
+        self.expiry = _parse_yymmdd(self._expiry)
 
-            # Usual flow
-            _split = option_symbol.split("_")
+        self.call_or_put = option_symbol[_len + 6].upper()
 
-            self.underlying_symbol = _split[0]
+        self.strike_price = int(option_symbol[_len + 7 :]) / 1000
 
-            self._expiry = _split[1][:6]
+        self.strike_price = (
+            int(float(self.strike_price))
+            if int(float(self.strike_price)) == float(self.strike_price)
+            else self.strike_price
+        )
 
-            self.expiry = datetime.date(
-                int(datetime.date.today().strftime("%Y")[:2] + self._expiry[4:6]),
-                int(self._expiry[:2]),
-                int(self._expiry[2:4]),
-            )
+        self.option_symbol = f"{self.underlying_symbol}{option_symbol[_len:]}"
+
+    def _parse_tda(self, option_symbol: str, symbol_format: str = "tda"):
+        if symbol_format == "tos":
+            option_symbol, num = option_symbol[1:].upper(), 0
 
-            self.call_or_put = _split[1][6]
+            for char in option_symbol:
+                if char.isalpha():
+                    num += 1
+                    continue
+                break
 
-            self.strike_price = (
-                int(float(_split[1][7:])) if float(_split[1][7:]) == int(float(_split[1][7:])) else float(_split[1][7:])
+            option_symbol = (
+                f"{option_symbol[:num]}_{option_symbol[num+2:num+4]}{option_symbol[num+4:num+6]}"
+                f"{option_symbol[num:num+2]}{option_symbol[num+6:]}"
             )
 
-            self.option_symbol = option_symbol
+        # Usual flow. format is fixed (TICKER_MMDDYYC123.45), so slice around the underscore directly
+        _us = option_symbol.find("_")
 
-        elif symbol_format in ["trade_station", "ibkr"]:
-            split = option_symbol.split(" ")
-            self.underlying_symbol, rem = split[0], split[1]
+        self.underlying_symbol = sys.intern(option_symbol[:_us])
 
-            self._expiry = rem[:6]
-            self.expiry = datetime.date(
-                int(datetime.date.today().strftime("%Y")[:2] + self._expiry[:2]),
-                int(self._expiry[2:4]),
-                int(self._expiry[4:6]),
-            )
+        self._expiry = option_symbol[_us + 1 : _us + 7]
 
-            self.call_or_put = rem[6].upper()
+        self.expiry = _parse_yymmdd(self._expiry[4:6] + self._expiry[:4])
 
-            self.strike_price = int(rem[7:]) / 1000 if symbol_format == "ibkr" else float(rem[7:])
+        self.call_or_put = option_symbol[_us + 7]
 
-            self.strike_price = (
-                int(float(self.strike_price))
-                if int(float(self.strike_price)) == float(self.strike_price)
-                else self.strike_price
-            )
+        _strike = float(option_symbol[_us + 8 :])
+
+        self.strike_price = int(_strike) if _strike == int(_strike) else _strike
 
-            self.option_symbol = option_symbol
+        self.option_symbol = option_symbol
+
+    def _parse_ibkr(self, option_symbol: str, symbol_format: str = "ibkr"):
+        split = option_symbol.split(" ")
+        self.underlying_symbol, rem = sys.intern(split[0]), split[1]
+
+        self._expiry = rem[:6]
+        self.expiry = _parse_yymmdd(self._expiry)
+
+        self.call_or_put = rem[6].upper()
+
+        self.strike_price = int(rem[7:]) / 1000 if symbol_format == "ibkr" else float(rem[7:])
+
+        self.strike_price = (
+            int(float(self.strike_price))
+            if int(float(self.strike_price)) == float(self.strike_price)
+            else self.strike_price
+        )
+
+        self.option_symbol = option_symbol
+
+    # format -> parser. Resolved once per construction instead of a chain of string comparisons
+    _PARSERS = {
+        "polygon": _parse_polygon,
+        "tradier": _parse_polygon,
+        "tda": _parse_tda,
+        "tos": _parse_tda,
+        "trade_station": _parse_ibkr,
+        "ibkr": _parse_ibkr,
+    }
 
     def __repr__(self):
         return (
@@ -2224,10 +2311,52 @@ class OptionSymbol:
         )
 
 
+@lru_cache(maxsize=131072)
+def _parse_option_symbol_cached(option_symbol: str, _format: str) -> tuple:
+    # Parsing is pure, so the same symbol (common when scanning chains or streams) is only parsed once. A tuple is
+    # cached instead of the object/list/dict since those are mutable and handed over to the caller.
+    if _format in ["polygon", "tradier"]:
+        _obj = OptionSymbol.from_polygon(option_symbol)
+    else:
+        _obj = OptionSymbol(option_symbol, symbol_format=_format)
+
+    return _obj.underlying_symbol, _obj.expiry, _obj.call_or_put, _obj.strike_price, _obj.option_symbol, _obj._expiry
+
+
+def _build_parsed_output(parsed: tuple, output_format):
+    # list/dict outputs are built straight from the parsed tuple. An OptionSymbol is only created when asked for
+    if output_format in ["list", list]:
+        return list(parsed[:5])
+
+    if output_format in ["dict", dict]:
+        return {
+            "underlying_symbol": parsed[0],
+            "strike_price": parsed[3],
+            "expiry": parsed[1],
+            "call_or_put": parsed[2],
+            "option_symbol": parsed[4],
+        }
+
+    return OptionSymbol._from_parsed(parsed)
+
+
+def _parse_yymmdd(expiry: str) -> datetime.date:
+    if not expiry.isdigit() or len(expiry) != 6:
+        raise ValueError(f"Invalid expiry: ({expiry}) in option symbol. Expected 6 digits in format YYMMDD")
+
+    # one int() for all 6 digits, then split the fields arithmetically
+    year, month_day = divmod(int(expiry), 10000)
+    month, day = divmod(month_day, 100)
+
+    return datetime.date(_CENTURY_BASE + year, month, day)
+
+
+@lru_cache(maxsize=4096)
 def ensure_prefix(symbol: str):
     """
     Ensure that the option symbol has the prefix ``O:`` as needed by polygon endpoints. If it does, make no changes. If
-    it doesn't, add the prefix and return the new value.
+    it doesn't, add the prefix and return the new value. Results are cached since the same symbols are usually
+    requested over and over (e.g. polling loops).
 
     :param symbol: the option symbol to check
     """
@@ -2236,16 +2365,22 @@ def ensure_prefix(symbol: str):
             "Option symbol length must at least be 15 letters. See documentation on option symbols for " "more info"
         )
 
-    if symbol.upper().startswith("O:"):
-        return symbol.upper()
+    symbol = symbol.upper()
+
+    if symbol[:2] != "O:":
+        symbol = f"O:{symbol}"
 
-    return f"O:{symbol.upper()}"
+    # prefixed symbols commonly end up as dict keys in user code. Interning keeps lookups cheap (short symbols only)
+    return sys.intern(symbol) if len(symbol) < 40 else symbol
 
 
 def _change_enum(val: Union[str, Enum, float, int], allowed_type=str):
+    if val is None or type(val) is allowed_type:  # hot path. unset, or already of the plain required type
+        return val
+
     if isinstance(val, Enum):
         try:
-            return val.value
+            return val._value_  # plain attribute. .value goes through a descriptor on every access
 
         except AttributeError:
             raise ValueError(
@@ -6,6 +6,34 @@ import asyncio
 
 # ========================================================= #
 
+# seconds for which responses of slowly changing reference data are served from the client's in-process cache.
+# see ``clear_cache()`` on the clients to drop cached responses
+TICKER_TYPES_CACHE_TTL = 86400
+TICKER_DETAILS_CACHE_TTL = 300
+EXCHANGES_CACHE_TTL = 86400
+CONDITIONS_CACHE_TTL = 86400
+MARKET_HOLIDAYS_CACHE_TTL = 86400
+MARKET_STATUS_CACHE_TTL = 10  # kept short, the status flips around the open/close
+
+# ========================================================= #
+
+
+def _ticker_details_or_none(symbol: str, result, warnings: bool = True):
+    """
+    Used by the bulk ticker details functions. Returns the response if it is a successful (``OK``) ticker details
+    response. Exceptions and error responses (e.g. ``NOT_FOUND`` for an unknown symbol) give ``None``.
+    """
+    if isinstance(result, dict) and result.get("status") == "OK":
+        return result
+
+    if warnings:
+        print(f"Could not get data for {symbol}. Returned: {result}")
+
+    return None
+
+
+# ========================================================= #
+
 
 def ReferenceClient(
     api_key: str,
@@ -146,7 +174,7 @@ class SyncReferenceClient(base_client.BaseClient):
                  If pagination is set to True, will return a merged response of all pages for convenience.
         """
 
-        date = self.normalize_datetime(date, output_type="str")
+        date = self._fmt_date(date)
 
         symbol_type, market = self._change_enum(symbol_type, str), self._change_enum(market, str)
         sort, order = self._change_enum(sort, str), self._change_enum(order, str)
@@ -192,7 +220,8 @@ class SyncReferenceClient(base_client.BaseClient):
         :param raw_response: whether to return the ``Response`` Object. Useful for when you need to say check the
                              status code or inspect the headers. Defaults to False which returns the json decoded
                              dictionary.
-        :return: A JSON decoded Dictionary by default. Make ``raw_response=True`` to get underlying response object
+        :return: A JSON decoded Dictionary by default. Make ``raw_response=True`` to get underlying response object.
+                 Decoded responses are cached by the client for a day. Use ``clear_cache()`` to force a refresh.
         """
 
         asset_class, locale = self._change_enum(asset_class, str), self._change_enum(locale, str)
@@ -201,12 +230,10 @@ class SyncReferenceClient(base_client.BaseClient):
 
         _data = {"asset_class": asset_class, "locale": locale}
 
-        _res = self._get_response(_path, params=_data)
-
         if raw_response:
-            return _res
+            return self._get_response(_path, params=_data)
 
-        return self.to_json_safe(_res)
+        return self._get_cached_response(_path, params=_data, ttl=TICKER_TYPES_CACHE_TTL)
 
     def get_ticker_details(self, symbol: str, date=None, raw_response: bool = False):
         """
@@ -221,21 +248,20 @@ class SyncReferenceClient(base_client.BaseClient):
         :param raw_response: whether to return the ``Response`` Object. Useful for when you need to say check the
                              status code or inspect the headers. Defaults to False which returns the json decoded
                              dictionary.
-        :return: A JSON decoded Dictionary by default. Make ``raw_response=True`` to get underlying response object
+        :return: A JSON decoded Dictionary by default. Make ``raw_response=True`` to get underlying response object.
+                 Decoded responses are cached by the client for 5 minutes. Use ``clear_cache()`` to force a refresh.
         """
 
-        date = self.normalize_datetime(date, output_type="str")
+        date = self._fmt_date(date)
 
         _path = f"/v3/reference/tickers/{symbol.upper()}"
 
         _data = {"date": date}
 
-        _res = self._get_response(_path, params=_data)
-
         if raw_response:
-            return _res
+            return self._get_response(_path, params=_data)
 
-        return self.to_json_safe(_res)
+        return self._get_cached_response(_path, params=_data, ttl=TICKER_DETAILS_CACHE_TTL)
 
     def get_bulk_ticker_details(
         self,
@@ -312,6 +338,64 @@ class SyncReferenceClient(base_client.BaseClient):
 
         return final_results if sort_order == "asc" else OrderedDict(reversed(list(final_results.items())))
 
+    def get_bulk_ticker_details_for_symbols(
+        self,
+        symbols: list,
+        date=None,
+        run_parallel: bool = True,
+        warnings: bool = True,
+        max_concurrent_workers: int = os.cpu_count() * 5,
+    ) -> OrderedDict:
+        """
+        Get ticker details for many symbols on the same date. This is the multi-symbol counterpart of
+        :meth:`get_bulk_ticker_details`, useful for scanning a universe of symbols.
+        `Official Docs <https://polygon.io/docs/stocks/get_v3_reference_tickers__ticker>`__
+
+        :param symbols: A list of ticker symbols to get data for. e.g. ``['AMD', 'NVDA']``
+        :param date: Specify a point in time to get information about the tickers available on that date. Defaults to
+                     the most recent available date.
+        :param run_parallel: If true (the default), the requests are sent in parallel using an internal ``ThreadPool``.
+                             Set to False to get all responses in sequence (will take time)
+        :param warnings: Defaults to True which prints warnings. Set to False to disable warnings.
+        :param max_concurrent_workers: This is only used if run_parallel is set to true. Controls how many worker
+                                       threads are spawned in the internal thread pool. Defaults to ``your cpu core
+                                       count * 5``
+        :return: An OrderedDict where keys are the symbols (in the order supplied), and values are corresponding
+                 ticker details. Symbols for which the request raised or the API returned an error (any ``status``
+                 other than ``OK``, e.g. ``NOT_FOUND``) get ``None``.
+        """
+
+        symbols, final_results = [symbol.upper() for symbol in symbols], OrderedDict()
+
+        if run_parallel:  # parallel run
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=max_concurrent_workers) as pool:
+                futures = OrderedDict(
+                    (symbol, pool.submit(self.get_ticker_details, symbol, date)) for symbol in symbols
+                )
+
+            for symbol, future in futures.items():
+                try:
+                    result = future.result()
+                except Exception as exc:
+                    result = exc
+
+                final_results[symbol] = _ticker_details_or_none(symbol, result, warnings)
+
+            return final_results
+
+        # Sequential Run
+        for symbol in symbols:
+            try:
+                result = self.get_ticker_details(symbol, date)
+            except Exception as exc:
+                result = exc
+
+            final_results[symbol] = _ticker_details_or_none(symbol, result, warnings)
+
+        return final_results
+
     def get_option_contract(self, ticker: str, as_of_date=None, raw_response: bool = False):
         """
         get Info about an option contract
@@ -328,7 +412,7 @@ class SyncReferenceClient(base_client.BaseClient):
         :return: A JSON decoded Dictionary by default. Make ``raw_response=True`` to get underlying response object
         """
 
-        as_of_date = self.normalize_datetime(as_of_date, output_type="str")
+        as_of_date = self._fmt_date(as_of_date)
 
         _path = f"/v3/reference/options/contracts/{ensure_prefix(ticker)}"
 
@@ -402,17 +486,12 @@ class SyncReferenceClient(base_client.BaseClient):
         :return: A JSON decoded Dictionary by default. Make ``raw_response=True`` to get underlying response object.
                  If pagination is set to True, will return a merged response of all pages for convenience.
         """
-        expiration_date = self.normalize_datetime(expiration_date, output_type="str")
-
-        expiration_date_lt = self.normalize_datetime(expiration_date_lt, output_type="str")
-
-        expiration_date_lte = self.normalize_datetime(expiration_date_lte, output_type="str")
-
-        expiration_date_gt = self.normalize_datetime(expiration_date_gt, output_type="str")
-
-        expiration_date_gte = self.normalize_datetime(expiration_date_gte, output_type="str")
-
-        as_of_date = self.normalize_datetime(as_of_date, output_type="str")
+        expiration_date = self._fmt_date(expiration_date)
+        expiration_date_lt = self._fmt_date(expiration_date_lt)
+        expiration_date_lte = self._fmt_date(expiration_date_lte)
+        expiration_date_gt = self._fmt_date(expiration_date_gt)
+        expiration_date_gte = self._fmt_date(expiration_date_gte)
+        as_of_date = self._fmt_date(as_of_date)
 
         contract_type = self._change_enum(contract_type, str)
         sort, order = self._change_enum(sort, str), self._change_enum(order, str)
@@ -506,7 +585,7 @@ class SyncReferenceClient(base_client.BaseClient):
                  If pagination is set to True, will return a merged response of all pages for convenience.
         """
 
-        published_utc = self.normalize_datetime(published_utc, output_type="str")
+        published_utc = self._fmt_date(published_utc)
 
         published_utc_lt = self.normalize_datetime(published_utc_lt)
 
@@ -652,45 +731,26 @@ class SyncReferenceClient(base_client.BaseClient):
                  If pagination is set to True, will return a merged response of all pages for convenience.
         """
 
-        ex_dividend_date = self.normalize_datetime(ex_dividend_date, output_type="str")
-
-        record_date = self.normalize_datetime(record_date, output_type="str")
-
-        declaration_date = self.normalize_datetime(declaration_date, output_type="str")
-
-        pay_date = self.normalize_datetime(pay_date, output_type="str")
-
-        ex_dividend_date_lt = self.normalize_datetime(ex_dividend_date_lt, output_type="str")
-
-        ex_dividend_date_lte = self.normalize_datetime(ex_dividend_date_lte, output_type="str")
-
-        ex_dividend_date_gt = self.normalize_datetime(ex_dividend_date_gt, output_type="str")
-
-        ex_dividend_date_gte = self.normalize_datetime(ex_dividend_date_gte, output_type="str")
-
-        record_date_lt = self.normalize_datetime(record_date_lt, output_type="str")
-
-        record_date_lte = self.normalize_datetime(record_date_lte, output_type="str")
-
-        record_date_gt = self.normalize_datetime(record_date_gt, output_type="str")
-
-        record_date_gte = self.normalize_datetime(record_date_gte, output_type="str")
-
-        declaration_date_lt = self.normalize_datetime(declaration_date_lt, output_type="str")
-
-        declaration_date_lte = self.normalize_datetime(declaration_date_lte, output_type="str")
-
-        declaration_date_gt = self.normalize_datetime(declaration_date_gt, output_type="str")
-
-        declaration_date_gte = self.normalize_datetime(declaration_date_gte, output_type="str")
-
-        pay_date_lt = self.normalize_datetime(pay_date_lt, output_type="str")
-
-        pay_date_lte = self.normalize_datetime(pay_date_lte, output_type="str")
-
-        pay_date_gt = self.normalize_datetime(pay_date_gt, output_type="str")
-
-        pay_date_gte = self.normalize_datetime(pay_date_gte, output_type="str")
+        ex_dividend_date = self._fmt_date(ex_dividend_date)
+        record_date = self._fmt_date(record_date)
+        declaration_date = self._fmt_date(declaration_date)
+        pay_date = self._fmt_date(pay_date)
+        ex_dividend_date_lt = self._fmt_date(ex_dividend_date_lt)
+        ex_dividend_date_lte = self._fmt_date(ex_dividend_date_lte)
+        ex_dividend_date_gt = self._fmt_date(ex_dividend_date_gt)
+        ex_dividend_date_gte = self._fmt_date(ex_dividend_date_gte)
+        record_date_lt = self._fmt_date(record_date_lt)
+        record_date_lte = self._fmt_date(record_date_lte)
+        record_date_gt = self._fmt_date(record_date_gt)
+        record_date_gte = self._fmt_date(record_date_gte)
+        declaration_date_lt = self._fmt_date(declaration_date_lt)
+        declaration_date_lte = self._fmt_date(declaration_date_lte)
+        declaration_date_gt = self._fmt_date(declaration_date_gt)
+        declaration_date_gte = self._fmt_date(declaration_date_gte)
+        pay_date_lt = self._fmt_date(pay_date_lt)
+        pay_date_lte = self._fmt_date(pay_date_lte)
+        pay_date_gt = self._fmt_date(pay_date_gt)
+        pay_date_gte = self._fmt_date(pay_date_gte)
 
         sort, order = self._change_enum(sort, str), self._change_enum(order, str)
         frequency, dividend_type = self._change_enum(frequency, int), self._change_enum(dividend_type, str)
@@ -765,7 +825,7 @@ class SyncReferenceClient(base_client.BaseClient):
         time_frame=None,
         include_sources: bool = False,
         order="asc",
-        limit: int = 50,
+        limit: int = 100,
         sort="filing_date",
         all_pages: bool = False,
         max_pages: int = None,
@@ -806,7 +866,7 @@ class SyncReferenceClient(base_client.BaseClient):
                                 point. See the xpath and formula response attributes for more info. ``False`` by default
         :param order: Order results based on the sort field. 'asc' by default. See :class:`polygon.enums.SortOrder`
                       for choices.
-        :param limit: number of max results to obtain. defaults to 50.
+        :param limit: number of max results to obtain. defaults to 100 which is also the max.
         :param sort: Sort field key used for ordering. 'filing_date' default. see
                      :class:`polygon.enums.StockFinancialsSortKey` for choices.
         :param all_pages: Whether to paginate through next/previous pages internally. Defaults to False. If set to True,
@@ -828,25 +888,16 @@ class SyncReferenceClient(base_client.BaseClient):
         :return: A JSON decoded Dictionary by default. Make ``raw_response=True`` to get underlying response object
         """
 
-        filing_date = self.normalize_datetime(filing_date, output_type="str")
-
-        period_of_report_date = self.normalize_datetime(period_of_report_date, output_type="str")
-
-        filing_date_lt = self.normalize_datetime(filing_date_lt, output_type="str")
-
-        filing_date_lte = self.normalize_datetime(filing_date_lte, output_type="str")
-
-        filing_date_gt = self.normalize_datetime(filing_date_gt, output_type="str")
-
-        filing_date_gte = self.normalize_datetime(filing_date_gte, output_type="str")
-
-        period_of_report_date_lt = self.normalize_datetime(period_of_report_date_lt, output_type="str")
-
-        period_of_report_date_lte = self.normalize_datetime(period_of_report_date_lte, output_type="str")
-
-        period_of_report_date_gt = self.normalize_datetime(period_of_report_date_gt, output_type="str")
-
-        period_of_report_date_gte = self.normalize_datetime(period_of_report_date_gte, output_type="str")
+        filing_date = self._fmt_date(filing_date)
+        period_of_report_date = self._fmt_date(period_of_report_date)
+        filing_date_lt = self._fmt_date(filing_date_lt)
+        filing_date_lte = self._fmt_date(filing_date_lte)
+        filing_date_gt = self._fmt_date(filing_date_gt)
+        filing_date_gte = self._fmt_date(filing_date_gte)
+        period_of_report_date_lt = self._fmt_date(period_of_report_date_lt)
+        period_of_report_date_lte = self._fmt_date(period_of_report_date_lte)
+        period_of_report_date_gt = self._fmt_date(period_of_report_date_gt)
+        period_of_report_date_gte = self._fmt_date(period_of_report_date_gte)
 
         time_frame = self._change_enum(time_frame)
         order, sort = self._change_enum(order), self._change_enum(sort)
@@ -952,15 +1003,11 @@ class SyncReferenceClient(base_client.BaseClient):
                  If pagination is set to True, will return a merged response of all pages for convenience.
         """
 
-        execution_date = self.normalize_datetime(execution_date, output_type="str")
-
-        execution_date_lt = self.normalize_datetime(execution_date_lt, output_type="str")
-
-        execution_date_lte = self.normalize_datetime(execution_date_lte, output_type="str")
-
-        execution_date_gt = self.normalize_datetime(execution_date_gt, output_type="str")
-
-        execution_date_gte = self.normalize_datetime(execution_date_gte, output_type="str")
+        execution_date = self._fmt_date(execution_date)
+        execution_date_lt = self._fmt_date(execution_date_lt)
+        execution_date_lte = self._fmt_date(execution_date_lte)
+        execution_date_gt = self._fmt_date(execution_date_gt)
+        execution_date_gte = self._fmt_date(execution_date_gte)
 
         sort, order = self._change_enum(sort, str), self._change_enum(order, str)
 
@@ -1001,17 +1048,16 @@ class SyncReferenceClient(base_client.BaseClient):
         :param raw_response: whether to return the ``Response`` Object. Useful for when you need to say check the
                              status code or inspect the headers. Defaults to False which returns the json decoded
                              dictionary.
-        :return: A JSON decoded Dictionary by default. Make ``raw_response=True`` to get underlying response object
+        :return: A JSON decoded Dictionary by default. Make ``raw_response=True`` to get underlying response object.
+                 Decoded responses are cached by the client for a day. Use ``clear_cache()`` to force a refresh.
         """
 
         _path = "/v1/marketstatus/upcoming"
 
-        _res = self._get_response(_path)
-
         if raw_response:
-            return _res
+            return self._get_response(_path)
 
-        return self.to_json_safe(_res)
+        return self._get_cached_response(_path, ttl=MARKET_HOLIDAYS_CACHE_TTL)
 
     def get_market_status(self, raw_response: bool = False):
         """
@@ -1021,17 +1067,16 @@ class SyncReferenceClient(base_client.BaseClient):
         :param raw_response: whether to return the ``Response`` Object. Useful for when you need to say check the
                              status code or inspect the headers. Defaults to False which returns the json decoded
                              dictionary.
-        :return: A JSON decoded Dictionary by default. Make ``raw_response=True`` to get underlying response object
+        :return: A JSON decoded Dictionary by default. Make ``raw_response=True`` to get underlying response object.
+                 Decoded responses are cached by the client for 10 seconds. Use ``clear_cache()`` to force a refresh.
         """
 
         _path = "/v1/marketstatus/now"
 
-        _res = self._get_response(_path)
-
         if raw_response:
-            return _res
+            return self._get_response(_path)
 
-        return self.to_json_safe(_res)
+        return self._get_cached_response(_path, ttl=MARKET_STATUS_CACHE_TTL)
 
     def get_conditions(
         self,
@@ -1040,7 +1085,7 @@ class SyncReferenceClient(base_client.BaseClient):
         condition_id=None,
         sip=None,
         order=None,
-        limit: int = 50,
+        limit: int = 1000,
         sort="name",
         all_pages: bool = False,
         max_pages: int = None,
@@ -1060,7 +1105,7 @@ class SyncReferenceClient(base_client.BaseClient):
         :param condition_id: Filter for conditions with a given ID
         :param sip: Filter by SIP. If the condition contains a mapping for that SIP, the condition will be returned.
         :param order: Order results. See :class:`polygon.enums.SortOrder` for choices.
-        :param limit: limit the number of results. defaults to 50.
+        :param limit: limit the number of results. defaults to 1000 which is also the max.
         :param sort: Sort field used for ordering. Defaults to 'name'. See :class:`polygon.enums.ConditionsSortKey`
                      for choices.
         :param all_pages: Whether to paginate through next/previous pages internally. Defaults to False. If set to True,
@@ -1080,7 +1125,8 @@ class SyncReferenceClient(base_client.BaseClient):
         :param raw_response: whether to return the ``Response`` Object. Useful for when you need to say check the
                              status code or inspect the headers. Defaults to False which returns the json decoded
                              dictionary.
-        :return: A JSON decoded Dictionary by default. Make ``raw_response=True`` to get underlying response object
+        :return: A JSON decoded Dictionary by default. Make ``raw_response=True`` to get underlying response object.
+                 Single page responses are cached by the client for a day. Use ``clear_cache()`` to force a refresh.
         """
 
         asset_class, data_type = self._change_enum(asset_class), self._change_enum(data_type)
@@ -1098,13 +1144,13 @@ class SyncReferenceClient(base_client.BaseClient):
             "sort": sort,
         }
 
-        _res = self._get_response(_path, params=_data)
-
         if not all_pages:  # don't you dare paginate!!
             if raw_response:
-                return _res
+                return self._get_response(_path, params=_data)
 
-            return self.to_json_safe(_res)
+            return self._get_cached_response(_path, params=_data, ttl=CONDITIONS_CACHE_TTL)
+
+        _res = self._get_response(_path, params=_data)
 
         return self._paginate(_res, merge_all_pages, max_pages, verbose=verbose, raw_page_responses=raw_page_responses)
 
@@ -1118,7 +1164,8 @@ class SyncReferenceClient(base_client.BaseClient):
         :param raw_response: whether to return the ``Response`` Object. Useful for when you need to say check the
                              status code or inspect the headers. Defaults to False which returns the json decoded
                              dictionary.
-        :return: A JSON decoded Dictionary by default. Make ``raw_response=True`` to get underlying response object
+        :return: A JSON decoded Dictionary by default. Make ``raw_response=True`` to get underlying response object.
+                 Decoded responses are cached by the client for a day. Use ``clear_cache()`` to force a refresh.
         """
 
         asset_class, locale = self._change_enum(asset_class), self._change_enum(locale)
@@ -1127,12 +1174,10 @@ class SyncReferenceClient(base_client.BaseClient):
 
         _data = {"asset_class": asset_class, "locale": locale}
 
-        _res = self._get_response(_path, params=_data)
-
         if raw_response:
-            return _res
+            return self._get_response(_path, params=_data)
 
-        return self.to_json_safe(_res)
+        return self._get_cached_response(_path, params=_data, ttl=EXCHANGES_CACHE_TTL)
 
 
 # ========================================================= #
@@ -1243,7 +1288,7 @@ class AsyncReferenceClient(base_client.BaseAsyncClient):
                  If pagination is set to True, will return a merged response of all pages for convenience.
         """
 
-        date = self.normalize_datetime(date, output_type="str")
+        date = self._fmt_date(date)
 
         symbol_type, market = self._change_enum(symbol_type, str), self._change_enum(market, str)
         sort, order = self._change_enum(sort, str), self._change_enum(order, str)
@@ -1291,7 +1336,8 @@ class AsyncReferenceClient(base_client.BaseAsyncClient):
         :param raw_response: whether to return the ``Response`` Object. Useful for when you need to say check the
                              status code or inspect the headers. Defaults to False which returns the json decoded
                              dictionary.
-        :return: A JSON decoded Dictionary by default. Make ``raw_response=True`` to get underlying response object
+        :return: A JSON decoded Dictionary by default. Make ``raw_response=True`` to get underlying response object.
+                 Decoded responses are cached by the client for a day. Use ``clear_cache()`` to force a refresh.
         """
 
         asset_class, locale = self._change_enum(asset_class, str), self._change_enum(locale, str)
@@ -1300,12 +1346,10 @@ class AsyncReferenceClient(base_client.BaseAsyncClient):
 
         _data = {"asset_class": asset_class, "locale": locale}
 
-        _res = await self._get_response(_path, params=_data)
-
         if raw_response:
-            return _res
+            return await self._get_response(_path, params=_data)
 
-        return self.to_json_safe(_res)
+        return await self._get_cached_response(_path, params=_data, ttl=TICKER_TYPES_CACHE_TTL)
 
     async def get_ticker_details(self, symbol: str, date=None, raw_response: bool = False):
         """
@@ -1320,21 +1364,20 @@ class AsyncReferenceClient(base_client.BaseAsyncClient):
         :param raw_response: whether to return the ``Response`` Object. Useful for when you need to say check the
                              status code or inspect the headers. Defaults to False which returns the json decoded
                              dictionary.
-        :return: A JSON decoded Dictionary by default. Make ``raw_response=True`` to get underlying response object
+        :return: A JSON decoded Dictionary by default. Make ``raw_response=True`` to get underlying response object.
+                 Decoded responses are cached by the client for 5 minutes. Use ``clear_cache()`` to force a refresh.
         """
 
-        date = self.normalize_datetime(date, output_type="str")
+        date = self._fmt_date(date)
 
         _path = f"/v3/reference/tickers/{symbol.upper()}"
 
         _data = {"date": date}
 
-        _res = await self._get_response(_path, params=_data)
-
         if raw_response:
-            return _res
+            return await self._get_response(_path, params=_data)
 
-        return self.to_json_safe(_res)
+        return await self._get_cached_response(_path, params=_data, ttl=TICKER_DETAILS_CACHE_TTL)
 
     async def get_bulk_ticker_details(
         self,
@@ -1412,6 +1455,55 @@ class AsyncReferenceClient(base_client.BaseAsyncClient):
 
         return final_results if sort_order == "asc" else OrderedDict(reversed(list(final_results.items())))
 
+    async def get_bulk_ticker_details_for_symbols(
+        self,
+        symbols: list,
+        date=None,
+        run_parallel: bool = True,
+        warnings: bool = True,
+        max_concurrent_workers: int = os.cpu_count() * 5,
+    ) -> OrderedDict:
+        """
+        Get ticker details for many symbols on the same date - Async method. This is the multi-symbol counterpart of
+        :meth:`get_bulk_ticker_details`, useful for scanning a universe of symbols.
+        `Official Docs <https://polygon.io/docs/stocks/get_v3_reference_tickers__ticker>`__
+
+        :param symbols: A list of ticker symbols to get data for. e.g. ``['AMD', 'NVDA']``
+        :param date: Specify a point in time to get information about the tickers available on that date. Defaults to
+                     the most recent available date.
+        :param run_parallel: If true (the default), the requests are run as concurrent coroutines. Set to False to get
+                             all responses in sequence (will take time)
+        :param warnings: Defaults to True which prints warnings. Set to False to disable warnings.
+        :param max_concurrent_workers: This is only used if run_parallel is set to true. Controls how many coroutines
+                                       are spawned at a time. Defaults to ``your cpu core count * 5``
+        :return: An OrderedDict where keys are the symbols (in the order supplied), and values are corresponding
+                 ticker details. Symbols for which the request raised or the API returned an error (any ``status``
+                 other than ``OK``, e.g. ``NOT_FOUND``) get ``None``.
+        """
+
+        symbols, final_results = [symbol.upper() for symbol in symbols], OrderedDict()
+
+        if run_parallel:  # parallel run
+            results = await self._gather_bounded(
+                [self.get_ticker_details(symbol, date) for symbol in symbols], max_concurrent_workers
+            )
+
+            for symbol, result in zip(symbols, results):
+                final_results[symbol] = _ticker_details_or_none(symbol, result, warnings)
+
+            return final_results
+
+        # Sequential Run
+        for symbol in symbols:
+            try:
+                result = await self.get_ticker_details(symbol, date)
+            except Exception as exc:
+                result = exc
+
+            final_results[symbol] = _ticker_details_or_none(symbol, result, warnings)
+
+        return final_results
+
     async def get_option_contract(self, ticker: str, as_of_date=None, raw_response: bool = False):
         """
         get Info about an option contract
@@ -1428,7 +1520,7 @@ class AsyncReferenceClient(base_client.BaseAsyncClient):
         :return: A JSON decoded Dictionary by default. Make ``raw_response=True`` to get underlying response object
         """
 
-        as_of_date = self.normalize_datetime(as_of_date, output_type="str")
+        as_of_date = self._fmt_date(as_of_date)
 
         _path = f"/v3/reference/options/contracts/{ensure_prefix(ticker)}"
 
@@ -1441,6 +1533,37 @@ class AsyncReferenceClient(base_client.BaseAsyncClient):
 
         return self.to_json_safe(_res)
 
+    async def get_bulk_option_contracts(
+        self,
+        tickers: list,
+        as_of_date=None,
+        max_concurrent_workers: int = os.cpu_count() * 5,
+        raw_response: bool = False,
+    ) -> list:
+        """
+        Get Info about many option contracts concurrently - Async method. Each request is the same as
+        :meth:`get_option_contract`, but all of them run concurrently instead of one after another.
+
+        :param tickers: A list of option tickers in standard format. Eg: ``['O:TSLA210903C00700000',
+                        'TSLA210903P00700000']``
+        :param as_of_date: Specify a point in time for the contracts. You can pass a ``datetime`` or ``date`` object or
+                           a string in format ``YYYY-MM-DD``. Defaults to today's date
+        :param max_concurrent_workers: Max number of requests allowed in flight at a time. Defaults to
+                                       ``your cpu core count * 5``
+        :param raw_response: whether to return the ``Response`` Objects. Useful for when you need to say
+                             check the status code or inspect the headers. Defaults to False which returns the json
+                             decoded dictionaries.
+        :return: A list of responses in the same order as ``tickers``. If a request fails, the exception is placed at
+                 its position in the list instead of being raised.
+        """
+
+        as_of_date = self._fmt_date(as_of_date)
+
+        return await self._gather_bounded(
+            [self.get_option_contract(ticker, as_of_date, raw_response=raw_response) for ticker in tickers],
+            max_concurrent_workers,
+        )
+
     async def get_option_contracts(
         self,
         underlying_ticker: str = None,
@@ -1502,17 +1625,12 @@ class AsyncReferenceClient(base_client.BaseAsyncClient):
         :return: A JSON decoded Dictionary by default. Make ``raw_response=True`` to get underlying response object.
                  If pagination is set to True, will return a merged response of all pages for convenience.
         """
-        expiration_date = self.normalize_datetime(expiration_date, output_type="str")
-
-        expiration_date_lt = self.normalize_datetime(expiration_date_lt, output_type="str")
-
-        expiration_date_lte = self.normalize_datetime(expiration_date_lte, output_type="str")
-
-        expiration_date_gt = self.normalize_datetime(expiration_date_gt, output_type="str")
-
-        expiration_date_gte = self.normalize_datetime(expiration_date_gte, output_type="str")
-
-        as_of_date = self.normalize_datetime(as_of_date, output_type="str")
+        expiration_date = self._fmt_date(expiration_date)
+        expiration_date_lt = self._fmt_date(expiration_date_lt)
+        expiration_date_lte = self._fmt_date(expiration_date_lte)
+        expiration_date_gt = self._fmt_date(expiration_date_gt)
+        expiration_date_gte = self._fmt_date(expiration_date_gte)
+        as_of_date = self._fmt_date(as_of_date)
 
         contract_type = self._change_enum(contract_type, str)
         sort, order = self._change_enum(sort, str), self._change_enum(order, str)
@@ -1608,7 +1726,7 @@ class AsyncReferenceClient(base_client.BaseAsyncClient):
                  If pagination is set to True, will return a merged response of all pages for convenience.
         """
 
-        published_utc = self.normalize_datetime(published_utc, output_type="str")
+        published_utc = self._fmt_date(published_utc)
 
         published_utc_lt = self.normalize_datetime(published_utc_lt)
 
@@ -1756,45 +1874,26 @@ class AsyncReferenceClient(base_client.BaseAsyncClient):
                  If pagination is set to True, will return a merged response of all pages for convenience.
         """
 
-        ex_dividend_date = self.normalize_datetime(ex_dividend_date, output_type="str")
-
-        record_date = self.normalize_datetime(record_date, output_type="str")
-
-        declaration_date = self.normalize_datetime(declaration_date, output_type="str")
-
-        pay_date = self.normalize_datetime(pay_date, output_type="str")
-
-        ex_dividend_date_lt = self.normalize_datetime(ex_dividend_date_lt, output_type="str")
-
-        ex_dividend_date_lte = self.normalize_datetime(ex_dividend_date_lte, output_type="str")
-
-        ex_dividend_date_gt = self.normalize_datetime(ex_dividend_date_gt, output_type="str")
-
-        ex_dividend_date_gte = self.normalize_datetime(ex_dividend_date_gte, output_type="str")
-
-        record_date_lt = self.normalize_datetime(record_date_lt, output_type="str")
-
-        record_date_lte = self.normalize_datetime(record_date_lte, output_type="str")
-
-        record_date_gt = self.normalize_datetime(record_date_gt, output_type="str")
-
-        record_date_gte = self.normalize_datetime(record_date_gte, output_type="str")
-
-        declaration_date_lt = self.normalize_datetime(declaration_date_lt, output_type="str")
-
-        declaration_date_lte = self.normalize_datetime(declaration_date_lte, output_type="str")
-
-        declaration_date_gt = self.normalize_datetime(declaration_date_gt, output_type="str")
-
-        declaration_date_gte = self.normalize_datetime(declaration_date_gte, output_type="str")
-
-        pay_date_lt = self.normalize_datetime(pay_date_lt, output_type="str")
-
-        pay_date_lte = self.normalize_datetime(pay_date_lte, output_type="str")
-
-        pay_date_gt = self.normalize_datetime(pay_date_gt, output_type="str")
-
-        pay_date_gte = self.normalize_datetime(pay_date_gte, output_type="str")
+        ex_dividend_date = self._fmt_date(ex_dividend_date)
+        record_date = self._fmt_date(record_date)
+        declaration_date = self._fmt_date(declaration_date)
+        pay_date = self._fmt_date(pay_date)
+        ex_dividend_date_lt = self._fmt_date(ex_dividend_date_lt)
+        ex_dividend_date_lte = self._fmt_date(ex_dividend_date_lte)
+        ex_dividend_date_gt = self._fmt_date(ex_dividend_date_gt)
+        ex_dividend_date_gte = self._fmt_date(ex_dividend_date_gte)
+        record_date_lt = self._fmt_date(record_date_lt)
+        record_date_lte = self._fmt_date(record_date_lte)
+        record_date_gt = self._fmt_date(record_date_gt)
+        record_date_gte = self._fmt_date(record_date_gte)
+        declaration_date_lt = self._fmt_date(declaration_date_lt)
+        declaration_date_lte = self._fmt_date(declaration_date_lte)
+        declaration_date_gt = self._fmt_date(declaration_date_gt)
+        declaration_date_gte = self._fmt_date(declaration_date_gte)
+        pay_date_lt = self._fmt_date(pay_date_lt)
+        pay_date_lte = self._fmt_date(pay_date_lte)
+        pay_date_gt = self._fmt_date(pay_date_gt)
+        pay_date_gte = self._fmt_date(pay_date_gte)
 
         sort, order = self._change_enum(sort, str), self._change_enum(order, str)
         frequency, dividend_type = self._change_enum(frequency, int), self._change_enum(dividend_type, str)
@@ -1871,7 +1970,7 @@ class AsyncReferenceClient(base_client.BaseAsyncClient):
         time_frame=None,
         include_sources: bool = False,
         order="asc",
-        limit: int = 50,
+        limit: int = 100,
         sort="filing_date",
         all_pages: bool = False,
         max_pages: int = None,
@@ -1912,7 +2011,7 @@ class AsyncReferenceClient(base_client.BaseAsyncClient):
                                 point. See the xpath and formula response attributes for more info. ``False`` by default
         :param order: Order results based on the sort field. 'asc' by default. See :class:`polygon.enums.SortOrder`
                       for choices.
-        :param limit: number of max results to obtain. defaults to 50.
+        :param limit: number of max results to obtain. defaults to 100 which is also the max.
         :param sort: Sort field key used for ordering. 'filing_date' default. see
                      :class:`polygon.enums.StockFinancialsSortKey` for choices.
         :param all_pages: Whether to paginate through next/previous pages internally. Defaults to False. If set to True,
@@ -1934,25 +2033,16 @@ class AsyncReferenceClient(base_client.BaseAsyncClient):
         :return: A JSON decoded Dictionary by default. Make ``raw_response=True`` to get underlying response object
         """
 
-        filing_date = self.normalize_datetime(filing_date, output_type="str")
-
-        period_of_report_date = self.normalize_datetime(period_of_report_date, output_type="str")
-
-        filing_date_lt = self.normalize_datetime(filing_date_lt, output_type="str")
-
-        filing_date_lte = self.normalize_datetime(filing_date_lte, output_type="str")
-
-        filing_date_gt = self.normalize_datetime(filing_date_gt, output_type="str")
-
-        filing_date_gte = self.normalize_datetime(filing_date_gte, output_type="str")
-
-        period_of_report_date_lt = self.normalize_datetime(period_of_report_date_lt, output_type="str")
-
-        period_of_report_date_lte = self.normalize_datetime(period_of_report_date_lte, output_type="str")
-
-        period_of_report_date_gt = self.normalize_datetime(period_of_report_date_gt, output_type="str")
-
-        period_of_report_date_gte = self.normalize_datetime(period_of_report_date_gte, output_type="str")
+        filing_date = self._fmt_date(filing_date)
+        period_of_report_date = self._fmt_date(period_of_report_date)
+        filing_date_lt = self._fmt_date(filing_date_lt)
+        filing_date_lte = self._fmt_date(filing_date_lte)
+        filing_date_gt = self._fmt_date(filing_date_gt)
+        filing_date_gte = self._fmt_date(filing_date_gte)
+        period_of_report_date_lt = self._fmt_date(period_of_report_date_lt)
+        period_of_report_date_lte = self._fmt_date(period_of_report_date_lte)
+        period_of_report_date_gt = self._fmt_date(period_of_report_date_gt)
+        period_of_report_date_gte = self._fmt_date(period_of_report_date_gte)
 
         time_frame = self._change_enum(time_frame)
         order, sort = self._change_enum(order), self._change_enum(sort)
@@ -2060,15 +2150,11 @@ class AsyncReferenceClient(base_client.BaseAsyncClient):
                  If pagination is set to True, will return a merged response of all pages for convenience.
         """
 
-        execution_date = self.normalize_datetime(execution_date, output_type="str")
-
-        execution_date_lt = self.normalize_datetime(execution_date_lt, output_type="str")
-
-        execution_date_lte = self.normalize_datetime(execution_date_lte, output_type="str")
-
-        execution_date_gt = self.normalize_datetime(execution_date_gt, output_type="str")
-
-        execution_date_gte = self.normalize_datetime(execution_date_gte, output_type="str")
+        execution_date = self._fmt_date(execution_date)
+        execution_date_lt = self._fmt_date(execution_date_lt)
+        execution_date_lte = self._fmt_date(execution_date_lte)
+        execution_date_gt = self._fmt_date(execution_date_gt)
+        execution_date_gte = self._fmt_date(execution_date_gte)
 
         sort, order = self._change_enum(sort, str), self._change_enum(order, str)
 
@@ -2111,17 +2197,16 @@ class AsyncReferenceClient(base_client.BaseAsyncClient):
         :param raw_response: whether to return the ``Response`` Object. Useful for when you need to say check the
                              status code or inspect the headers. Defaults to False which returns the json decoded
                              dictionary.
-        :return: A JSON decoded Dictionary by default. Make ``raw_response=True`` to get underlying response object
+        :return: A JSON decoded Dictionary by default. Make ``raw_response=True`` to get underlying response object.
+                 Decoded responses are cached by the client for a day. Use ``clear_cache()`` to force a refresh.
         """
 
         _path = "/v1/marketstatus/upcoming"
 
-        _res = await self._get_response(_path)
-
         if raw_response:
-            return _res
+            return await self._get_response(_path)
 
-        return self.to_json_safe(_res)
+        return await self._get_cached_response(_path, ttl=MARKET_HOLIDAYS_CACHE_TTL)
 
     async def get_market_status(self, raw_response: bool = False):
         """
@@ -2131,17 +2216,16 @@ class AsyncReferenceClient(base_client.BaseAsyncClient):
         :param raw_response: whether to return the ``Response`` Object. Useful for when you need to say check the
                              status code or inspect the headers. Defaults to False which returns the json decoded
                              dictionary.
-        :return: A JSON decoded Dictionary by default. Make ``raw_response=True`` to get underlying response object
+        :return: A JSON decoded Dictionary by default. Make ``raw_response=True`` to get underlying response object.
+                 Decoded responses are cached by the client for 10 seconds. Use ``clear_cache()`` to force a refresh.
         """
 
         _path = "/v1/marketstatus/now"
 
-        _res = await self._get_response(_path)
-
         if raw_response:
-            return _res
+            return await self._get_response(_path)
 
-        return self.to_json_safe(_res)
+        return await self._get_cached_response(_path, ttl=MARKET_STATUS_CACHE_TTL)
 
     async def get_conditions(
         self,
@@ -2150,7 +2234,7 @@ class AsyncReferenceClient(base_client.BaseAsyncClient):
         condition_id=None,
         sip=None,
         order=None,
-        limit: int = 50,
+        limit: int = 1000,
         sort="name",
         all_pages: bool = False,
         max_pages: int = None,
@@ -2170,7 +2254,7 @@ class AsyncReferenceClient(base_client.BaseAsyncClient):
         :param condition_id: Filter for conditions with a given ID
         :param sip: Filter by SIP. If the condition contains a mapping for that SIP, the condition will be returned.
         :param order: Order results. See :class:`polygon.enums.SortOrder` for choices.
-        :param limit: limit the number of results. defaults to 50.
+        :param limit: limit the number of results. defaults to 1000 which is also the max.
         :param sort: Sort field used for ordering. Defaults to 'name'. See :class:`polygon.enums.ConditionsSortKey`
                      for choices.
         :param all_pages: Whether to paginate through next/previous pages internally. Defaults to False. If set to True,
@@ -2189,7 +2273,8 @@ class AsyncReferenceClient(base_client.BaseAsyncClient):
         :param raw_response: whether to return the ``Response`` Object. Useful for when you need to say check the
                              status code or inspect the headers. Defaults to False which returns the json decoded
                              dictionary.
-        :return: A JSON decoded Dictionary by default. Make ``raw_response=True`` to get underlying response object
+        :return: A JSON decoded Dictionary by default. Make ``raw_response=True`` to get underlying response object.
+                 Single page responses are cached by the client for a day. Use ``clear_cache()`` to force a refresh.
         """
         asset_class, data_type = self._change_enum(asset_class), self._change_enum(data_type)
         order, sort = self._change_enum(order), self._change_enum(sort)
@@ -2206,13 +2291,13 @@ class AsyncReferenceClient(base_client.BaseAsyncClient):
             "sort": sort,
         }
 
-        _res = await self._get_response(_path, params=_data)
-
         if not all_pages:  # don't you dare paginate!!
             if raw_response:
-                return _res
+                return await self._get_response(_path, params=_data)
 
-            return self.to_json_safe(_res)
+            return await self._get_cached_response(_path, params=_data, ttl=CONDITIONS_CACHE_TTL)
+
+        _res = await self._get_response(_path, params=_data)
 
         return await self._paginate(
             _res, merge_all_pages, max_pages, verbose=verbose, raw_page_responses=raw_page_responses
@@ -2228,7 +2313,8 @@ class AsyncReferenceClient(base_client.BaseAsyncClient):
         :param raw_response: whether to return the ``Response`` Object. Useful for when you need to say check the
                              status code or inspect the headers. Defaults to False which returns the json decoded
                              dictionary.
-        :return: A JSON decoded Dictionary by default. Make ``raw_response=True`` to get underlying response object
+        :return: A JSON decoded Dictionary by default. Make ``raw_response=True`` to get underlying response object.
+                 Decoded responses are cached by the client for a day. Use ``clear_cache()`` to force a refresh.
         """
 
         asset_class, locale = self._change_enum(asset_class), self._change_enum(locale)
@@ -2237,12 +2323,10 @@ class AsyncReferenceClient(base_client.BaseAsyncClient):
 
         _data = {"asset_class": asset_class, "locale": locale}
 
-        _res = await self._get_response(_path, params=_data)
-
         if raw_response:
-            return _res
+            return await self._get_response(_path, params=_data)
 
-        return self.to_json_safe(_res)
+        return await self._get_cached_response(_path, params=_data, ttl=EXCHANGES_CACHE_TTL)
 
 
 # ========================================================= #
@@ -1,6 +1,7 @@
 # ========================================================= #
 from .. import base_client
 from os import cpu_count
+import warnings
 
 # ========================================================= #
 
@@ -202,18 +203,22 @@ class SyncStocksClient(base_client.BaseClient):
 
     @staticmethod
     def get_trades_vx(*args, **kwargs):
-        print(
+        warnings.warn(
             f"This method has been removed as polygon changed this endpoint to v3 (yeah I don't like that behavior "
             f'either from polygon. Please use "get_trades_v3", you can use the exact same arguments. the function '
-            f"did not change :)"
+            f"did not change :)",
+            FutureWarning,
+            stacklevel=2,
         )
 
     @staticmethod
     def get_quotes_vx(*args, **kwargs):
-        print(
+        warnings.warn(
             f"This method has been removed as polygon changed this endpoint to v3 (yeah I don't like that behavior "
             f'either from polygon. Please use "get_quotes_v3", you can use the exact same arguments. the function '
-            f"did not change :)"
+            f"did not change :)",
+            FutureWarning,
+            stacklevel=2,
         )
 
     def get_quotes(
@@ -1287,18 +1292,22 @@ class AsyncStocksClient(base_client.BaseAsyncClient):
 
     @staticmethod
     async def get_trades_vx(*args, **kwargs):
-        print(
+        warnings.warn(
             f"This method has been removed as polygon changed this endpoint to v3 (yeah I don't like that behavior "
             f'either from polygon. Please use "get_trades_v3", you can use the exact same arguments. the function '
-            f"did not change :)"
+            f"did not change :)",
+            FutureWarning,
+            stacklevel=2,
         )
 
     @staticmethod
     async def get_quotes_vx(*args, **kwargs):
-        print(
+        warnings.warn(
             f"This method has been removed as polygon changed this endpoint to v3 (yeah I don't like that behavior "
             f'either from polygon. Please use "get_quotes_v3", you can use the exact same arguments. the function '
-            f"did not change :)"
+            f"did not change :)",
+            FutureWarning,
+            stacklevel=2,
         )
 
     async def get_quotes(
@@ -39,6 +39,12 @@ setup(
     ],
     python_requires=">=3.6",
     install_requires=["requests", "websockets", "websocket-client", "httpx"],
-    extras_require={"uvloop": ["uvloop"], "orjson": ["orjson"], "all": ["orjson", "uvloop"]},
+    extras_require={
+        "uvloop": ["uvloop"],
+        "orjson": ["orjson"],
+        "http2": ["h2"],
+        "brotli": ["brotli"],
+        "all": ["orjson", "uvloop", "h2", "brotli"],
+    },
     keywords="finance trading equities bonds options research data markets",
 )